@@ -1,8 +1,18 @@
 #!/bin/bash
 
-echo "=== previous jobs begin ==="
-tail /root/experiments/job_queue/jobs.log
-echo "=== previous jobs end ==="
+jobs_log="/root/experiments/job_queue/jobs.log"
+
+# JOB_QUEUE_VERBOSE=0/false/no 时不回显历史任务
+case "${JOB_QUEUE_VERBOSE,,}" in
+  0|false|no) show_previous_jobs=0 ;;
+  *) show_previous_jobs=1 ;;
+esac
+
+if [[ "$show_previous_jobs" == 1 ]]; then
+  echo "=== previous jobs begin ==="
+  tail "$jobs_log"
+  echo "=== previous jobs end ==="
+fi
 
 # 解析参数
 target_pid="$1"
@@ -11,31 +21,48 @@ post_command="$@"
 
 if [[ -z "$target_pid" || -z "$post_command" ]]; then
   echo "Usage: $0 <pid_to_wait_for> <command_to_run_after_pid_exits>"
+  echo "  JOB_QUEUE_VERBOSE=0|false|no  don't print the previous jobs from jobs.log"
   exit 1
 fi
 
-timestamp="$(date '+%Y%m%d_%H%M%S')"
-log_file="/root/log/wait_then_run_$timestamp.log"
+# bash 内建 printf %(...)T 取时间，省掉一次 $(date) 的 fork
+printf -v timestamp '%(%Y%m%d_%H%M%S)T' -1
+# 加上本进程 PID，同一秒内多次调用不会写进同一个日志文件
+log_file="/root/log/wait_then_run_${timestamp}_$$.log"
 
 # 在子进程中执行主逻辑
+# set -m 让后台 watcher 成为独立进程组的组长（PGID == watcher PID），
+# 停止时一个 kill -- -<job PID> 即可连同 eval 出来的整棵进程树一起发信号。
+# 开了 job control 后 bash 不再把后台任务的 stdin 接到 /dev/null，这里显式重定向，
+# 避免任务读终端（被 SIGTTIN 挂起、脚本退出后又被 SIGHUP）
+set -m
 (
   echo "[wait_then_run.sh] Started to wait for PID $target_pid then run command: $post_command"
 
   # 等待目标进程结束
-  while kill -0 "$target_pid" 2>/dev/null; do
-    echo "$(date '+%Y%m%d %H:%M:%S') - $target_pid still alive, wait"
-    sleep 10
-  done
+  # GNU tail --pid 在单个进程里阻塞到目标退出，不再每 10 秒 fork 一次 date/sleep；
+  # 不支持 --pid 的 tail 会立即失败，此时退回轮询
+  printf '%(%Y%m%d %H:%M:%S)T - waiting for PID %s (via tail --pid)\n' -1 "$target_pid"
+  if ! tail --pid="$target_pid" -f /dev/null 2>/dev/null; then
+    while kill -0 "$target_pid" 2>/dev/null; do
+      printf '%(%Y%m%d %H:%M:%S)T - %s still alive, wait\n' -1 "$target_pid"
+      sleep 10
+    done
+  fi
 
   echo "[wait_then_run.sh] PID $target_pid has exited. Running command: $post_command"
   eval "$post_command"
-) >> $log_file 2>&1 &
+) < /dev/null >> "$log_file" 2>&1 &
 
 # 输出这个 watcher 脚本本身的 PID
 watcher_pid=$!
-echo "[wait_then_run.sh] wait PID: $target_pid | job PID: $watcher_pid | job command: $post_command | log_file: $log_file"
+set +m
+# 摘要行只拼一次，stdout 和 jobs.log 各写一次
+summary="[wait_then_run.sh] wait PID: $target_pid | job PID: $watcher_pid | job command: $post_command | log_file: $log_file"
+echo "$summary"
+echo "[wait_then_run.sh] to stop the job and its children: kill -- -$watcher_pid"
 # also dump to log file
-echo "[wait_then_run.sh] wait PID: $target_pid | job PID: $watcher_pid | job command: $post_command | log_file: $log_file" >> /root/experiments/job_queue/jobs.log 2>&1
+echo "$summary" >> "$jobs_log" 2>&1
 
 # can put in ~/.bashrc
 # wait_then_run() {